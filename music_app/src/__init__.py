@@ -1,7 +1,6 @@
 """Music application package."""
 from .config.config import AppConfig, load_config
 from .domain.models import Usuario, Cancion, Grabacion, Artista
-from .application.services import MusicService
 
 __version__ = "1.0.0"
 __all__ = [
@@ -12,4 +11,13 @@ __all__ = [
     "Grabacion",
     "Artista",
     "MusicService"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # MusicService is resolved on first access so importing the package
+    # (e.g. for `python -m src --help`) stays cheap.
+    if name == "MusicService":
+        from .application.services import MusicService
+        return MusicService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,41 +1,34 @@
 """Main CLI application."""
-from .presentation.commands import (
-    Command,
-    CrearUsuarioCommand,
-    CrearCancionCommand,
-    RegistrarGrabacionCommand,
-    RegistrarArtistaPaisCommand,
-    ActualizarNombreUsuarioCommand,
-    BorrarGrabacionesFechaCommand,
-    ConsultarUsuariosNombreCommand,
-    ConsultarUsuariosGrabacionCommand,
-    ConsultarArtistaPaisCommand,
-    ConsultarConteoArtistasPaisCommand,
-    ConsultarCancionesGeneroCommand,
-    ConsultarGrabacionesFechaCommand
-)
-from .infrastructure.init_db import initialize_database, verify_connection
-from .infrastructure.repositories import (
-    CassandraUsuarioRepository,
-    CassandraCancionRepository,
-    CassandraGrabacionRepository,
-    CassandraArtistaRepository
-)
-from .application.services import MusicService
 from .config.config import load_config, AppConfig
+import importlib
 import logging
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
-from cassandra.cluster import Cluster, Session
-from typing import Dict, Type
-
-# Load environment variables from .env file
-load_dotenv(Path(__file__).parent.parent / '.env')
+from typing import TYPE_CHECKING, Dict, Tuple, Type
 
+# Heavy modules (Cassandra driver, services, commands) are imported inside
+# the functions that need them so `--help` never pays their import cost.
+if TYPE_CHECKING:
+    from cassandra.cluster import Session
+    from .application.services import MusicService
+    from .infrastructure.cassandra_client import CassandraClient
+    from .presentation.commands import Command
 
 logger = logging.getLogger(__name__)
 
+_dotenv_loaded = False
+
+
+def _ensure_dotenv() -> None:
+    """Load environment variables from the .env file (only once)."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv(Path(__file__).parent.parent / '.env')
+    _dotenv_loaded = True
+
 
 def setup_logging(config: AppConfig) -> None:
     """Configure logging based on application config."""
@@ -46,23 +39,30 @@ def setup_logging(config: AppConfig) -> None:
     )
 
 
-def get_cassandra_session(config: AppConfig) -> Session:
-    """Get Cassandra session using configuration."""
-    try:
-        cluster = Cluster(
-            contact_points=config.cassandra.contact_points,
-            port=config.cassandra.port,
-            auth_provider=None  # Add auth if needed
-        )
-        session = cluster.connect(config.cassandra.keyspace)
-        return session
-    except Exception as e:
-        logger.error(f"Failed to connect to Cassandra: {e}")
-        raise
+def create_client(config: AppConfig) -> "CassandraClient":
+    """Build the Cassandra client whose session is shared by all repositories."""
+    from .infrastructure.cassandra_client import CassandraClient
+
+    return CassandraClient(
+        contact_points=config.cassandra.contact_points,
+        port=config.cassandra.port,
+        keyspace=config.cassandra.keyspace,
+        username=config.cassandra.username,
+        password=config.cassandra.password,
+        local_dc=config.cassandra.local_dc
+    )
 
 
-def setup_repositories(session: Session) -> MusicService:
+def setup_repositories(session: "Session") -> "MusicService":
     """Initialize repositories and service layer."""
+    from .infrastructure.repositories import (
+        CassandraUsuarioRepository,
+        CassandraCancionRepository,
+        CassandraGrabacionRepository,
+        CassandraArtistaRepository
+    )
+    from .application.services import MusicService
+
     usuario_repo = CassandraUsuarioRepository(session)
     cancion_repo = CassandraCancionRepository(session)
     grabacion_repo = CassandraGrabacionRepository(session)
@@ -76,26 +76,38 @@ def setup_repositories(session: Session) -> MusicService:
     )
 
 
-def get_commands() -> Dict[str, Type[Command]]:
-    """Get mapping of command options to command classes."""
-    return {
-        "1": CrearUsuarioCommand,
-        "2": CrearCancionCommand,
-        "3": RegistrarGrabacionCommand,
-        "4": RegistrarArtistaPaisCommand,
-        "5": ActualizarNombreUsuarioCommand,
-        "6": BorrarGrabacionesFechaCommand,
-        "7": ConsultarUsuariosNombreCommand,
-        "8": ConsultarUsuariosGrabacionCommand,
-        "9": ConsultarArtistaPaisCommand,
-        "10": ConsultarConteoArtistasPaisCommand,
-        "11": ConsultarCancionesGeneroCommand,
-        "12": ConsultarGrabacionesFechaCommand
-    }
+# Menu option -> (module, command class); imported on first use
+_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "1": (".presentation.commands", "CrearUsuarioCommand"),
+    "2": (".presentation.commands", "CrearCancionCommand"),
+    "3": (".presentation.commands", "RegistrarGrabacionCommand"),
+    "4": (".presentation.commands", "RegistrarArtistaPaisCommand"),
+    "5": (".presentation.commands", "ActualizarNombreUsuarioCommand"),
+    "6": (".presentation.commands", "BorrarGrabacionesFechaCommand"),
+    "7": (".presentation.commands", "ConsultarUsuariosNombreCommand"),
+    "8": (".presentation.commands", "ConsultarUsuariosGrabacionCommand"),
+    "9": (".presentation.commands", "ConsultarArtistaPaisCommand"),
+    "10": (".presentation.commands", "ConsultarConteoArtistasPaisCommand"),
+    "11": (".presentation.commands", "ConsultarCancionesGeneroCommand"),
+    "12": (".presentation.commands", "ConsultarGrabacionesFechaCommand")
+}
+_resolved_commands: Dict[str, Type["Command"]] = {}
+
+
+def resolve_command(op: str) -> Type["Command"]:
+    """Get the command class for a menu option, importing it on first use."""
+    command = _resolved_commands.get(op)
+    if command is None:
+        module, name = _COMMANDS[op]
+        command = getattr(importlib.import_module(module, __package__), name)
+        _resolved_commands[op] = command
+    return command
 
 
 def handle_init_db(config: AppConfig) -> None:
     """Initialize database schema."""
+    from .infrastructure.init_db import initialize_database
+
     print("Inicializando base de datos...")
     try:
         initialize_database(
@@ -103,7 +115,8 @@ def handle_init_db(config: AppConfig) -> None:
             port=config.cassandra.port,
             username=config.cassandra.username,
             password=config.cassandra.password,
-            keyspace=None  # Don't connect to keyspace initially
+            keyspace=None,  # Don't connect to keyspace initially
+            local_dc=config.cassandra.local_dc
         )
         print("✓ Base de datos inicializada correctamente")
         logger.info("Database initialization completed")
@@ -113,8 +126,32 @@ def handle_init_db(config: AppConfig) -> None:
         sys.exit(1)
 
 
+def handle_migrate_users_by_dni(config: AppConfig) -> None:
+    """Copy existing usuarios into USERS_BY_DNI (one-off migration)."""
+    from .infrastructure.init_db import migrate_users_by_dni
+
+    print("Copiando usuarios a USERS_BY_DNI...")
+    try:
+        copied = migrate_users_by_dni(
+            contact_points=config.cassandra.contact_points,
+            port=config.cassandra.port,
+            keyspace=config.cassandra.keyspace,
+            username=config.cassandra.username,
+            password=config.cassandra.password,
+            local_dc=config.cassandra.local_dc
+        )
+        print(f"✓ {copied} usuarios copiados")
+        logger.info("USERS_BY_DNI migration completed")
+    except Exception as e:
+        print(f"✗ Error al migrar usuarios: {e}")
+        logger.error(f"USERS_BY_DNI migration error: {e}")
+        sys.exit(1)
+
+
 def handle_verify_connection(config: AppConfig) -> None:
     """Verify database connection."""
+    from .infrastructure.init_db import verify_connection
+
     print("Verificando conexión a Cassandra...")
     try:
         if verify_connection(
@@ -122,7 +159,8 @@ def handle_verify_connection(config: AppConfig) -> None:
             port=config.cassandra.port,
             keyspace=config.cassandra.keyspace,
             username=config.cassandra.username,
-            password=config.cassandra.password
+            password=config.cassandra.password,
+            local_dc=config.cassandra.local_dc
         ):
             print("✓ Conexión verificada correctamente")
             logger.info("Connection verified")
@@ -135,37 +173,66 @@ def handle_verify_connection(config: AppConfig) -> None:
         sys.exit(1)
 
 
+def handle_batch_json(config: AppConfig) -> None:
+    """Bulk load JSON-lines records from stdin."""
+    from .presentation.commands import CargaMasivaJsonCommand
+
+    client = create_client(config)
+    try:
+        service = setup_repositories(client.connect())
+        CargaMasivaJsonCommand(service).execute()
+        logger.info("Batch JSON load completed")
+    except Exception as e:
+        print(f"✗ Error en la carga masiva: {e}")
+        logger.error(f"Batch JSON load error: {e}")
+        sys.exit(1)
+    finally:
+        client.shutdown()
+
+
 def handle_cli_commands() -> bool:
     """Handle command-line arguments. Returns True if a command was executed."""
     if len(sys.argv) <= 1:
         return False
 
     command = sys.argv[1]
-    config = load_config()
-    setup_logging(config)
 
-    if command == "--init-db":
-        handle_init_db(config)
-    elif command == "--verify-connection":
-        handle_verify_connection(config)
-    elif command == "--help":
+    # --help and unknown commands need neither configuration nor logging
+    if command == "--help":
         print("""
 Uso: python -m src [comando]
 
 Comandos disponibles:
   --init-db              Inicializar base de datos con esquema
   --verify-connection    Verificar conexión a Cassandra
+  --migrate-users-by-dni Copiar usuarios existentes a USERS_BY_DNI (una vez)
+  --batch-json           Cargar usuarios/canciones desde JSON lines en stdin
   --help                 Mostrar esta ayuda
   (sin argumentos)       Iniciar aplicación interactiva
         """)
-    else:
+        return True
+    if command not in ("--init-db", "--verify-connection", "--batch-json",
+                       "--migrate-users-by-dni"):
         print(f"Comando desconocido: {command}")
         sys.exit(1)
 
+    _ensure_dotenv()
+    config = load_config()
+    setup_logging(config)
+
+    if command == "--init-db":
+        handle_init_db(config)
+    elif command == "--batch-json":
+        handle_batch_json(config)
+    elif command == "--migrate-users-by-dni":
+        handle_migrate_users_by_dni(config)
+    else:
+        handle_verify_connection(config)
+
     return True
 
 
-def run_interactive_menu(service: MusicService, commands: Dict[str, Type[Command]]) -> None:
+def run_interactive_menu(service: "MusicService") -> None:
     """Run the interactive menu loop."""
     menu = """
 Seleccione una opción:
@@ -184,9 +251,24 @@ Seleccione una opción:
  0) Salir
 > """
 
+    if sys.stdin.isatty():
+        def read_option() -> str:
+            return input(menu)
+    else:
+        # Scripted/piped input: skip input()'s prompt handling per iteration
+        readline = sys.stdin.readline
+        write = sys.stdout.write
+
+        def read_option() -> str:
+            write(menu)
+            line = readline()
+            if not line:
+                raise EOFError
+            return line
+
     while True:
         try:
-            op = input(menu).strip()
+            op = read_option().strip()
         except EOFError:
             break
 
@@ -195,8 +277,8 @@ Seleccione una opción:
             break
 
         try:
-            if op in commands:
-                command = commands[op](service)
+            if op in _COMMANDS:
+                command = resolve_command(op)(service)
                 command.execute()
             else:
                 print("Opción inválida.")
@@ -214,25 +296,28 @@ def main() -> None:
         return
 
     # Load configuration
+    _ensure_dotenv()
     config = load_config()
     setup_logging(config)
 
     logger.info("Starting music application...")
 
+    # One cluster/session for the whole process, closed on exit
+    client = create_client(config)
     try:
         # Setup infrastructure
-        session = get_cassandra_session(config)
+        session = client.connect()
         service = setup_repositories(session)
-        commands = get_commands()
 
         # Run interactive menu
-        run_interactive_menu(service, commands)
+        run_interactive_menu(service)
 
     except Exception as e:
         logger.error(f"Error fatal: {e}")
         print(f"Error fatal: {e}")
     finally:
         logger.info("Cerrando aplicación...")
+        client.shutdown()
 
 
 if __name__ == "__main__":
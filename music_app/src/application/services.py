@@ -1,7 +1,6 @@
 """Service layer for business logic."""
 from datetime import date
-from typing import List, Optional, Set
-from cassandra.query import SimpleStatement
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
 
 from ..domain.models import Usuario, Cancion, Grabacion, Artista
 from ..domain.repositories import (
@@ -65,6 +64,20 @@ class MusicService:
         )
         self.cancion_repo.save(cancion)
 
+    def crear_usuarios(
+        self,
+        usuarios: Sequence[Usuario]
+    ) -> List[Tuple[Usuario, Exception]]:
+        """Create many usuarios at once (bulk load); returns the failures."""
+        return self.usuario_repo.save_many(usuarios)
+
+    def crear_canciones(
+        self,
+        canciones: Sequence[Cancion]
+    ) -> List[Tuple[Cancion, Exception]]:
+        """Create many canciones at once (bulk load); returns the failures."""
+        return self.cancion_repo.save_many(canciones)
+
     def registrar_grabacion(
         self,
         grabacion_cod: int,
@@ -102,18 +115,17 @@ class MusicService:
             pais_nombre=pais_nombre,
             sello_cod=sello_cod,
             sello_nombre=sello_nombre,
-            premios=premios if premios is not None else set()
+            premios=frozenset(premios or ())
         )
-        setattr(artista, 'isrc', cancion_isrc)  # Add ISRC for mapping
-        self.artista_repo.save_with_pais(artista)
+        self.artista_repo.save_with_pais(artista, cancion_isrc)
 
     def actualizar_nombre_usuario(
         self,
         dni: str,
         nuevo_nombre: str
-    ) -> None:
-        """Update usuario name."""
-        self.usuario_repo.update_nombre(dni, nuevo_nombre)
+    ) -> bool:
+        """Update usuario name. Returns False if no usuario has that DNI."""
+        return self.usuario_repo.update_nombre(dni, nuevo_nombre)
 
     def borrar_grabaciones_fecha(
         self,
@@ -133,7 +145,7 @@ class MusicService:
     def buscar_usuarios_por_grabacion(
         self,
         grabacion_cod: int
-    ) -> List[Grabacion]:
+    ) -> Iterable[Grabacion]:
         """Search usuarios by grabación code."""
         return self.grabacion_repo.get_by_codigo(grabacion_cod)
 
@@ -147,38 +159,27 @@ class MusicService:
         Este método obtiene información combinada de Tabla5 (canciones) 
         y Tabla3 (relación artista-país).
         """
-        # Primero buscamos en Tabla3 que tiene la información completa
-        query = SimpleStatement(
-            "SELECT * FROM MAPPING_ISRC WHERE Cancion_ISRC = %s")
-        rows = self.artista_repo.session.execute(query, [isrc])
-        artistas_tabla3 = [
-            Artista(
-                codigo=row.artista_cod,
-                nombre=row.artista_nombre,
-                pais_cod=row.pais_cod,
-                pais_nombre=row.pais_nombre,
-                sello_cod=row.sello_cod,
-                sello_nombre=row.sello_nombre,
-                premios=set(row.premios) if hasattr(
-                    row, 'premios') and row.premios is not None else set()
-            )
-            for row in rows
-        ]
+        # Lanzamos Tabla3 y Tabla5 en paralelo; Tabla5 solo se usa si
+        # Tabla3 no tiene resultados
+        fut_tabla3 = self.artista_repo.get_by_isrc_async(isrc)
+        fut_tabla5 = self.cancion_repo.get_by_isrc_async(isrc)
+
+        # Cancion_ISRC es la clave primaria de Tabla3: como mucho una fila
+        artistas = list(fut_tabla3.result())
 
         # Si encontramos resultados en Tabla3, los devolvemos
-        if artistas_tabla3:
-            return artistas_tabla3
+        if artistas:
+            return artistas
 
-        # Si no hay resultados en Tabla3, buscamos en Tabla5
-        canciones = self.cancion_repo.get_by_isrc(isrc)
+        # Si no hay resultados en Tabla3, usamos la respuesta de Tabla5
         return [
             Artista(
-                codigo=c.artista_cod,
-                nombre=c.artista_nombre,
+                codigo=row.artista_cod,
+                nombre=row.artista_nombre,
                 pais_cod=None,  # No disponible en Tabla5
                 pais_nombre=None  # No disponible en Tabla5
             )
-            for c in canciones
+            for row in fut_tabla5.result()
         ]
 
     def obtener_conteo_artistas_pais(
@@ -191,13 +192,13 @@ class MusicService:
     def buscar_canciones_por_genero(
         self,
         genero: str
-    ) -> List[Cancion]:
+    ) -> Iterable[Cancion]:
         """Search canciones by genre."""
         return self.cancion_repo.get_by_genero(genero)
 
     def buscar_grabaciones_por_fecha(
         self,
         fecha: date
-    ) -> List[Grabacion]:
+    ) -> Iterable[Grabacion]:
         """Search grabaciones by date."""
         return self.grabacion_repo.get_by_fecha(fecha)
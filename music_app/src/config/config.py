@@ -1,5 +1,6 @@
 """Configuration module for the application."""
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 import os
 from pathlib import Path
@@ -13,6 +14,7 @@ class CassandraConfig:
     port: int = 9042
     username: Optional[str] = None
     password: Optional[str] = None
+    local_dc: Optional[str] = None
 
 
 @dataclass
@@ -24,14 +26,19 @@ class AppConfig:
     max_retries: int = 3
 
 
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
-    """Load application configuration from environment variables."""
+    """Load application configuration from environment variables.
+
+    The result is cached: the environment is read once per process.
+    """
     cassandra_config = CassandraConfig(
         contact_points=os.getenv('CASSANDRA_HOSTS', '127.0.0.1').split(','),
         keyspace=os.getenv('CASSANDRA_KEYSPACE', 'alexvillegas'),
         port=int(os.getenv('CASSANDRA_PORT', '9042')),
         username=os.getenv('CASSANDRA_USERNAME'),
-        password=os.getenv('CASSANDRA_PASSWORD')
+        password=os.getenv('CASSANDRA_PASSWORD'),
+        local_dc=os.getenv('CASSANDRA_LOCAL_DC')
     )
 
     return AppConfig(
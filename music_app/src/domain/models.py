@@ -1,10 +1,13 @@
 """Domain models for the music application."""
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date
-from typing import Optional, Set
+from typing import FrozenSet, Optional, Set
 
+# Shared default for Artista.premios; frozensets are immutable
+_EMPTY_PREMIOS: FrozenSet[str] = frozenset()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Usuario:
     """Usuario entity."""
     nombre: str
@@ -13,7 +16,7 @@ class Usuario:
     telefono: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Cancion:
     """Canción entity."""
     isrc: str
@@ -25,7 +28,7 @@ class Cancion:
     artista_nombre: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Grabacion:
     """Grabación entity."""
     codigo: int
@@ -35,7 +38,7 @@ class Grabacion:
     duracion: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Artista:
     """Artista entity."""
     codigo: int
@@ -44,4 +47,4 @@ class Artista:
     pais_nombre: str
     sello_cod: Optional[int] = None
     sello_nombre: Optional[str] = None
-    premios: Set[str] = field(default_factory=set)
+    premios: FrozenSet[str] = _EMPTY_PREMIOS
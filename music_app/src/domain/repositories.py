@@ -1,7 +1,7 @@
 """Repository interfaces for the music application."""
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 from ..domain.models import Usuario, Cancion, Grabacion, Artista
 
 class IUsuarioRepository(ABC):
@@ -23,8 +23,13 @@ class IUsuarioRepository(ABC):
         pass
     
     @abstractmethod
-    def update_nombre(self, dni: str, nuevo_nombre: str) -> None:
-        """Update usuario nombre."""
+    def save_many(self, usuarios: Sequence[Usuario]) -> List[Tuple[Usuario, Exception]]:
+        """Save several usuarios concurrently; returns the ones that failed."""
+        pass
+    
+    @abstractmethod
+    def update_nombre(self, dni: str, nuevo_nombre: str) -> bool:
+        """Update usuario nombre. Returns False if no usuario has that DNI."""
         pass
 
 class ICancionRepository(ABC):
@@ -36,26 +41,39 @@ class ICancionRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_genero(self, genero: str) -> List[Cancion]:
-        """Get canciones by género."""
+    def get_by_isrc_async(self, isrc: str) -> Any:
+        """Start the ISRC lookup without blocking.
+
+        Returns a future whose result() yields the matching Cancion objects.
+        """
+        pass
+    
+    @abstractmethod
+    def get_by_genero(self, genero: str) -> Iterable[Cancion]:
+        """Get canciones by género (may be lazily paged)."""
         pass
     
     @abstractmethod
     def save(self, cancion: Cancion) -> None:
         """Save cancion."""
         pass
+    
+    @abstractmethod
+    def save_many(self, canciones: Sequence[Cancion]) -> List[Tuple[Cancion, Exception]]:
+        """Save several canciones concurrently; returns the ones that failed."""
+        pass
 
 class IGrabacionRepository(ABC):
     """Interface for Grabacion repository."""
     
     @abstractmethod
-    def get_by_codigo(self, codigo: int) -> List[Grabacion]:
-        """Get grabacion by código."""
+    def get_by_codigo(self, codigo: int) -> Iterable[Grabacion]:
+        """Get grabacion by código (may be lazily paged)."""
         pass
     
     @abstractmethod
-    def get_by_fecha(self, fecha: date) -> List[Grabacion]:
-        """Get grabaciones by fecha."""
+    def get_by_fecha(self, fecha: date) -> Iterable[Grabacion]:
+        """Get grabaciones by fecha (may be lazily paged)."""
         pass
     
     @abstractmethod
@@ -72,8 +90,16 @@ class IArtistaRepository(ABC):
     """Interface for Artista repository."""
     
     @abstractmethod
-    def save_with_pais(self, artista: Artista) -> None:
-        """Save artista with país information."""
+    def save_with_pais(self, artista: Artista, cancion_isrc: str) -> None:
+        """Save artista with país information for a canción ISRC."""
+        pass
+    
+    @abstractmethod
+    def get_by_isrc_async(self, isrc: str) -> Any:
+        """Start the artista/país lookup for a canción ISRC without blocking.
+
+        Returns a future whose result() yields the matching Artista objects.
+        """
         pass
     
     @abstractmethod
@@ -1,13 +1,96 @@
 """Cassandra client module for database initialization and connection management."""
 import logging
+import mmap
+import os
+import re
 import time
-from typing import Optional
-from cassandra.cluster import Cluster, Session
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple
+from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT, NoHostAvailable, Session
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.policies import FallthroughRetryPolicy
+from cassandra.concurrent import execute_concurrent
+from cassandra.query import PreparedStatement, named_tuple_factory
+from cassandra.policies import (
+    DCAwareRoundRobinPolicy,
+    ExponentialReconnectionPolicy,
+    FallthroughRetryPolicy,
+    TokenAwarePolicy
+)
 
 logger = logging.getLogger(__name__)
 
+_COMMENT_RE = re.compile(rb'--[^\n]*')
+_STMT_SPLIT_RE = re.compile(rb';\s*')
+
+# Seconds before a request without a response is failed by the driver
+REQUEST_TIMEOUT = 10
+
+# Max in-flight statements when running independent CREATE TABLEs
+SCHEMA_CONCURRENCY = 16
+
+# Prepared statements per session, keyed by CQL text. Keyed weakly on the
+# session itself (not id(session)) so a closed session's entries go away
+# and a new session can never pick up statements that reused its id.
+_PREPARED_CACHE: "weakref.WeakKeyDictionary[Session, Dict[str, PreparedStatement]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def prepare_cached(session: Session, cql: str) -> PreparedStatement:
+    """
+    Prepare a CQL statement once per session.
+
+    Later calls with the same session and CQL text return the cached
+    statement instead of sending another PREPARE to the cluster.
+
+    Args:
+        session: Cassandra session
+        cql: CQL text to prepare
+
+    Returns:
+        The prepared statement
+    """
+    statements = _PREPARED_CACHE.get(session)
+    if statements is None:
+        statements = _PREPARED_CACHE[session] = {}
+    statement = statements.get(cql)
+    if statement is None:
+        statement = statements[cql] = session.prepare(cql)
+    return statement
+
+
+def parse_cql_file(file_path: str) -> Tuple[str, ...]:
+    """
+    Read a CQL file and split it into statements.
+
+    Comments are removed and each statement is stripped, without its
+    trailing semicolon.
+
+    Args:
+        file_path: Path to .cql file
+
+    Returns:
+        The statements, in file order
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    # Map the file instead of reading it into a str; the regexes
+    # work on the mapped bytes and only statements are decoded
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            cleaned = b''
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                cleaned = _COMMENT_RE.sub(b'', mm)
+
+    # Split statements by semicolon
+    return tuple(
+        stmt.strip().decode('utf-8')
+        for stmt in _STMT_SPLIT_RE.split(cleaned)
+        if stmt.strip()
+    )
+
 
 class CassandraClient:
     """Manages Cassandra cluster and session connections."""
@@ -20,7 +103,8 @@ class CassandraClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         max_retries: int = 5,
-        retry_delay: int = 2
+        retry_delay: int = 2,
+        local_dc: Optional[str] = None
     ):
         """
         Initialize Cassandra client.
@@ -31,8 +115,10 @@ class CassandraClient:
             keyspace: Default keyspace to connect to
             username: Optional username for authentication
             password: Optional password for authentication
-            max_retries: Number of connection retries
-            retry_delay: Delay in seconds between retries
+            max_retries: Attempts for the initial connection when no host is up
+            retry_delay: Seconds between initial attempts; also the base delay
+                of the driver's reconnection backoff once connected
+            local_dc: Local datacenter; inferred from contact points if None
         """
         self.contact_points = contact_points
         self.port = port
@@ -41,12 +127,30 @@ class CassandraClient:
         self.password = password
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.local_dc = local_dc
         self.cluster: Optional[Cluster] = None
         self.session: Optional[Session] = None
 
+    def _execution_profiles(self) -> dict:
+        """Default profile: token-aware routing, request timeout, no driver retries."""
+        profile = ExecutionProfile(
+            load_balancing_policy=TokenAwarePolicy(
+                DCAwareRoundRobinPolicy(local_dc=self.local_dc)
+            ),
+            retry_policy=FallthroughRetryPolicy(),
+            request_timeout=REQUEST_TIMEOUT,
+            row_factory=named_tuple_factory
+        )
+        return {EXEC_PROFILE_DEFAULT: profile}
+
     def connect(self, use_system_keyspace: bool = False) -> Session:
         """
-        Connect to Cassandra cluster with retry logic.
+        Connect to Cassandra cluster.
+
+        The initial connection is retried up to max_retries times while no
+        host is available (e.g. the container is still starting). Once
+        connected, hosts that go down are reconnected by the driver with
+        exponential backoff (see ExponentialReconnectionPolicy).
 
         Args:
             use_system_keyspace: If True, connect to 'system' keyspace (for schema creation)
@@ -57,64 +161,70 @@ class CassandraClient:
         Raises:
             Exception: If unable to connect after max retries
         """
-        for attempt in range(self.max_retries):
+        logger.debug(f"  Hosts: {self.contact_points}, Port: {self.port}")
+
+        auth_provider = None
+        if self.username and self.password:
+            logger.debug(f"  Using authentication for user: {self.username}")
+            auth_provider = PlainTextAuthProvider(
+                username=self.username,
+                password=self.password
+            )
+
+        # Determinar a qué conectar
+        target_keyspace = None
+        if use_system_keyspace:
+            target_keyspace = 'system'
+            logger.debug("  Connecting to 'system' keyspace for schema creation")
+        elif self.keyspace:
+            target_keyspace = self.keyspace
+            logger.debug(f"  Connecting to '{self.keyspace}' keyspace")
+        else:
+            logger.debug("  Connecting without specific keyspace")
+
+        for attempt in range(1, self.max_retries + 1):
+            logger.info(
+                f"Connecting to Cassandra (attempt {attempt}/{self.max_retries})...")
+
+            # A failed connect shuts its cluster down, so each attempt
+            # builds a fresh one
+            self.cluster = Cluster(
+                contact_points=self.contact_points,
+                port=self.port,
+                auth_provider=auth_provider,
+                execution_profiles=self._execution_profiles(),
+                reconnection_policy=ExponentialReconnectionPolicy(
+                    base_delay=self.retry_delay,
+                    max_delay=self.retry_delay * 16
+                ),
+                protocol_version=4,
+                executor_threads=max(8, os.cpu_count() or 1),
+            )
+
+            # Conectar
             try:
-                logger.info(
-                    f"Connecting to Cassandra (attempt {attempt + 1}/{self.max_retries})..."
-                )
-                logger.debug(
-                    f"  Hosts: {self.contact_points}, Port: {self.port}")
-
-                auth_provider = None
-                if self.username and self.password:
-                    logger.debug(
-                        f"  Using authentication for user: {self.username}")
-                    auth_provider = PlainTextAuthProvider(
-                        username=self.username,
-                        password=self.password
-                    )
-
-                self.cluster = Cluster(
-                    contact_points=self.contact_points,
-                    port=self.port,
-                    auth_provider=auth_provider,
-                    default_retry_policy=FallthroughRetryPolicy(),
-                    protocol_version=4,
-                )
-
-                # Determinar a qué conectar
-                target_keyspace = None
-                if use_system_keyspace:
-                    target_keyspace = 'system'
-                    logger.debug(
-                        "  Connecting to 'system' keyspace for schema creation")
-                elif self.keyspace:
-                    target_keyspace = self.keyspace
-                    logger.debug(f"  Connecting to '{self.keyspace}' keyspace")
-                else:
-                    logger.debug("  Connecting without specific keyspace")
-
-                # Conectar
                 if target_keyspace:
                     self.session = self.cluster.connect(target_keyspace)
                 else:
                     self.session = self.cluster.connect()
-
-                logger.info("✓ Successfully connected to Cassandra")
-                return self.session
-
-            except Exception as e:
-                logger.warning(
-                    f"Connection attempt {attempt + 1} failed: {str(e)}"
-                )
-                logger.debug(f"  Error type: {type(e).__name__}")
-                if attempt < self.max_retries - 1:
-                    logger.info(f"Retrying in {self.retry_delay} seconds...")
-                    time.sleep(self.retry_delay)
-                else:
+            except NoHostAvailable as e:
+                self.cluster.shutdown()
+                if attempt == self.max_retries:
                     logger.error(
-                        "✗ Failed to connect to Cassandra after all retries")
+                        f"✗ Failed to connect to Cassandra after all retries: {str(e)}")
                     raise
+                logger.warning(f"Connection attempt {attempt} failed: {str(e)}")
+                logger.info(f"Retrying in {self.retry_delay} seconds...")
+                time.sleep(self.retry_delay)
+                continue
+            except Exception as e:
+                logger.error(f"✗ Failed to connect to Cassandra: {str(e)}")
+                logger.debug(f"  Error type: {type(e).__name__}")
+                self.cluster.shutdown()
+                raise
+
+            logger.info("✓ Successfully connected to Cassandra")
+            return self.session
 
     def shutdown(self) -> None:
         """Close Cassandra session and cluster."""
@@ -128,78 +238,53 @@ class CassandraClient:
         except Exception as e:
             logger.error(f"Error during shutdown: {str(e)}")
 
-    def execute_cql_file(self, file_path: str) -> None:
+    def execute_cql_statements(self, statements: Sequence[str]) -> None:
         """
-        Execute CQL statements from a file.
+        Execute already split CQL statements in order.
 
         Args:
-            file_path: Path to .cql file
+            statements: Stripped CQL statements without trailing semicolons
 
         Raises:
-            FileNotFoundError: If file doesn't exist
             Exception: If CQL execution fails
         """
         if not self.session:
             raise RuntimeError("Not connected to Cassandra")
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                cql_content = f.read()
-
-            # Split statements by semicolon and filter empty statements
-            raw_statements = cql_content.split(';')
-            statements = []
-
-            for stmt in raw_statements:
-                # Remove comments from start of statement
-                lines = stmt.strip().split('\n')
-                clean_lines = []
-                for line in lines:
-                    clean_line = line.strip()
-                    # Skip comment-only lines
-                    if clean_line and not clean_line.startswith('--'):
-                        clean_lines.append(clean_line)
-
-                # Join clean lines
-                clean_stmt = ' '.join(clean_lines).strip()
-
-                # Only add non-empty statements
-                if clean_stmt:
-                    statements.append(clean_stmt)
+            # CREATE TABLE statements are independent of each other, so runs
+            # of them are sent concurrently. Any other statement (keyspace,
+            # index, type...) may depend on earlier ones and acts as a barrier.
+            stage: List[Tuple[int, str]] = []
+            for i, statement in enumerate(statements, 1):
+                upper = statement.upper()
+                # Skip USE statements (keyspace is set after CREATE KEYSPACE)
+                if upper.startswith("USE "):
+                    logger.debug(
+                        f"  [{i}/{len(statements)}] Skipping USE statement (keyspace set after CREATE KEYSPACE)")
+                    continue
 
-            logger.info(
-                f"Executing {len(statements)} CQL statements from {file_path}")
+                if upper.startswith("CREATE TABLE"):
+                    stage.append((i, statement))
+                    continue
 
-            for i, statement in enumerate(statements, 1):
-                try:
-                    # Skip USE statements (they'll be handled after CREATE KEYSPACE)
-                    if statement.upper().startswith("USE "):
-                        logger.debug(
-                            f"  [{i}/{len(statements)}] Skipping USE statement (will reconnect)")
-                        continue
+                self._execute_stage(stage, len(statements))
+                stage = []
 
+                try:
                     logger.debug(
                         f"  [{i}/{len(statements)}] {statement[:60]}...")
                     self.session.execute(statement)
                     logger.debug(f"  ✓ Statement {i} executed")
 
-                    # If this was CREATE KEYSPACE, reconnect to the new keyspace
-                    if "CREATE KEYSPACE" in statement.upper() and self.keyspace:
+                    # If this was CREATE KEYSPACE, switch to the new keyspace
+                    # on the existing connection pool
+                    if "CREATE KEYSPACE" in upper and self.keyspace:
                         logger.info(
-                            f"  Reconnecting to keyspace '{self.keyspace}'...")
-                        self.session.shutdown()
-                        self.cluster.shutdown()
-                        # Reconnect to the new keyspace
-                        self.cluster = Cluster(
-                            contact_points=self.contact_points,
-                            port=self.port,
-                            auth_provider=None,
-                            default_retry_policy=FallthroughRetryPolicy(),
-                            protocol_version=4,
-                        )
-                        self.session = self.cluster.connect(self.keyspace)
+                            f"  Switching to keyspace '{self.keyspace}'...")
+                        self.session.set_keyspace(self.keyspace)
                         logger.info(
-                            f"  ✓ Connected to keyspace '{self.keyspace}'")
+                            f"  ✓ Using keyspace '{self.keyspace}'")
 
                 except Exception as e:
                     logger.error(
@@ -208,16 +293,51 @@ class CassandraClient:
                     logger.error(f"  Statement: {statement}")
                     raise
 
+            self._execute_stage(stage, len(statements))
+
             logger.info(
                 f"✓ All {len(statements)} CQL statements executed successfully")
 
-        except FileNotFoundError:
-            logger.error(f"✗ CQL file not found: {file_path}")
-            raise
         except Exception as e:
-            logger.error(f"✗ Error executing CQL file: {str(e)}")
+            logger.error(f"✗ Error executing CQL statements: {str(e)}")
             raise
 
+    def _execute_stage(self, stage: List[Tuple[int, str]], total: int) -> None:
+        """
+        Execute independent statements concurrently.
+
+        Args:
+            stage: (position, statement) pairs with no mutual dependencies
+            total: Total number of statements, for log messages
+
+        Raises:
+            Exception: The first error raised by any statement in the stage
+        """
+        if not stage:
+            return
+
+        logger.debug(
+            f"  [{stage[0][0]}-{stage[-1][0]}/{total}] "
+            f"Executing {len(stage)} statements concurrently")
+        results = execute_concurrent(
+            self.session,
+            [(statement, ()) for _, statement in stage],
+            concurrency=SCHEMA_CONCURRENCY,
+            raise_on_first_error=False
+        )
+
+        error = None
+        for (i, statement), (success, result) in zip(stage, results):
+            if success:
+                logger.debug(f"  ✓ Statement {i} executed")
+                continue
+            logger.error(f"✗ Error executing statement {i}: {str(result)}")
+            logger.error(f"  Statement: {statement}")
+            error = error or result
+
+        if error is not None:
+            raise error
+
     def get_session(self) -> Session:
         """Get current session."""
         if not self.session:
@@ -1,14 +1,26 @@
 """Database initialization utilities."""
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from .cassandra_client import CassandraClient
+from typing import Tuple
+from cassandra import ConsistencyLevel
+from cassandra.concurrent import execute_concurrent_with_args
+from cassandra.cluster import Session
+from .cassandra_client import CassandraClient, parse_cql_file, prepare_cached
 
 logger = logging.getLogger(__name__)
 
+# Health check query; system.local is node-local, so ONE is enough
+HEALTH_CHECK_CQL = "SELECT release_version FROM system.local"
 
+# Max in-flight inserts while copying USERS_BY_NAME into USERS_BY_DNI
+BACKFILL_CONCURRENCY = 64
+
+
+@lru_cache(maxsize=1)
 def get_schema_path() -> str:
-    """Get path to schema.cql file."""
+    """Get path to schema.cql file (resolved once per process)."""
     # Try multiple possible locations
     possible_paths = [
         Path(__file__).parent.parent.parent / "scripts" / "init_schema.cql",
@@ -25,12 +37,103 @@ def get_schema_path() -> str:
     )
 
 
+@lru_cache(maxsize=None)
+def get_schema_statements(schema_path: str) -> Tuple[str, ...]:
+    """Read and split a schema file once; later calls reuse the statements."""
+    return parse_cql_file(schema_path)
+
+
+def backfill_users_by_dni(session: Session, keyspace: str) -> int:
+    """
+    Copy every USERS_BY_NAME row into USERS_BY_DNI.
+
+    One-off migration: users saved before USERS_BY_DNI existed are only in
+    USERS_BY_NAME, so DNI lookups (and renames) would not find them. It
+    scans the whole table, so it is not part of --init-db; the copy is an
+    upsert and can be re-run safely.
+
+    Args:
+        session: Connected Cassandra session
+        keyspace: Keyspace that holds both tables
+
+    Returns:
+        Number of rows copied
+    """
+    rows = session.execute(
+        "SELECT Usuario_DNI, Usuario_Nombre, Usuario_Email, Usuario_Telefono "
+        f"FROM {keyspace}.USERS_BY_NAME"
+    )
+    insert = prepare_cached(
+        session,
+        f"INSERT INTO {keyspace}.USERS_BY_DNI "
+        "(Usuario_DNI, Usuario_Nombre, Usuario_Email, Usuario_Telefono) "
+        "VALUES (?, ?, ?, ?)"
+    )
+    # Pages are fetched here, on the calling thread, and each page is
+    # fanned out on its own: pulling the next page from inside
+    # execute_concurrent would block the driver's event loop
+    copied = 0
+    while True:
+        page = [tuple(row) for row in rows.current_rows]
+        if page:
+            execute_concurrent_with_args(
+                session, insert, page, concurrency=BACKFILL_CONCURRENCY)
+            copied += len(page)
+        if not rows.has_more_pages:
+            return copied
+        rows.fetch_next_page()
+
+
+def migrate_users_by_dni(
+    contact_points: list,
+    port: int = 9042,
+    keyspace: str = None,
+    username: str = None,
+    password: str = None,
+    local_dc: str = None
+) -> int:
+    """
+    Backfill USERS_BY_DNI from USERS_BY_NAME.
+
+    Args:
+        contact_points: List of Cassandra contact points
+        port: Cassandra port
+        keyspace: Keyspace that holds both tables
+        username: Optional authentication username
+        password: Optional authentication password
+        local_dc: Optional local datacenter for load balancing
+
+    Returns:
+        Number of rows copied
+    """
+    client = CassandraClient(
+        contact_points=contact_points,
+        port=port,
+        keyspace=keyspace,
+        username=username,
+        password=password,
+        local_dc=local_dc
+    )
+
+    try:
+        client.connect()
+        copied = backfill_users_by_dni(client.session, keyspace)
+        logger.info(f"✓ {copied} usuarios copied into USERS_BY_DNI")
+        return copied
+    except Exception as e:
+        logger.error(f"✗ USERS_BY_DNI migration failed: {str(e)}")
+        raise
+    finally:
+        client.shutdown()
+
+
 def initialize_database(
     contact_points: list,
     port: int = 9042,
     username: str = None,
     password: str = None,
-    keyspace: str = None
+    keyspace: str = None,
+    local_dc: str = None
 ) -> None:
     """
     Initialize Cassandra database with schema.
@@ -41,13 +144,15 @@ def initialize_database(
         username: Optional authentication username
         password: Optional authentication password
         keyspace: Optional keyspace to connect to (for initial connection)
+        local_dc: Optional local datacenter for load balancing
     """
     client = CassandraClient(
         contact_points=contact_points,
         port=port,
         keyspace=keyspace,
         username=username,
-        password=password
+        password=password,
+        local_dc=local_dc
     )
 
     try:
@@ -58,7 +163,7 @@ def initialize_database(
         # Execute schema file
         schema_path = get_schema_path()
         logger.info(f"Executing schema from: {schema_path}")
-        client.execute_cql_file(schema_path)
+        client.execute_cql_statements(get_schema_statements(schema_path))
 
         logger.info("✓ Database initialization completed successfully")
 
@@ -74,7 +179,8 @@ def verify_connection(
     port: int = 9042,
     keyspace: str = None,
     username: str = None,
-    password: str = None
+    password: str = None,
+    local_dc: str = None
 ) -> bool:
     """
     Verify connection to Cassandra.
@@ -85,6 +191,7 @@ def verify_connection(
         keyspace: Keyspace to connect to
         username: Optional authentication username
         password: Optional authentication password
+        local_dc: Optional local datacenter for load balancing
 
     Returns:
         True if connection successful, False otherwise
@@ -94,15 +201,20 @@ def verify_connection(
         port=port,
         keyspace=keyspace,
         username=username,
-        password=password
+        password=password,
+        local_dc=local_dc
     )
 
     try:
         logger.info("Verifying connection to Cassandra...")
         client.connect(use_system_keyspace=True)
-        result = client.session.execute("SELECT now() FROM system.local;")
-        timestamp = result[0][0] if result else "unknown"
-        logger.info(f"✓ Connection verified. Server time: {timestamp}")
+        # Prepared once per session; later checks only send the statement id
+        statement = prepare_cached(client.session, HEALTH_CHECK_CQL)
+        statement.consistency_level = ConsistencyLevel.ONE
+        statement.is_idempotent = True
+        row = client.session.execute(statement).one()
+        version = row.release_version if row else "unknown"
+        logger.info(f"✓ Connection verified. Server version: {version}")
         return True
     except Exception as e:
         logger.error(f"✗ Connection verification failed: {str(e)}")
@@ -1,9 +1,11 @@
 """Cassandra repository implementations."""
 from datetime import date
-from typing import List, Optional
-from cassandra.cluster import Session
-from cassandra.query import SimpleStatement
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from cassandra.cluster import EXEC_PROFILE_DEFAULT, ResponseFuture, Session
+from cassandra.concurrent import execute_concurrent, execute_concurrent_with_args
+from cassandra.query import BatchStatement, BatchType, PreparedStatement
 
+from .cassandra_client import prepare_cached
 from ..domain.models import Usuario, Cancion, Grabacion, Artista
 from ..domain.repositories import (
     IUsuarioRepository,
@@ -12,77 +14,196 @@ from ..domain.repositories import (
     IArtistaRepository
 )
 
+# Explicit projections, listed in the field order of the domain models
+_USUARIO_COLUMNS = "Usuario_Nombre, Usuario_DNI, Usuario_Email, Usuario_Telefono"
+_CANCION_COLUMNS = (
+    "Cancion_ISRC, Cancion_Titulo, Cancion_Anio, Cancion_Generos, "
+    "Cancion_Genero, Artista_Cod, Artista_Nombre"
+)
+_ARTISTA_COLUMNS = (
+    "Artista_Cod, Artista_Nombre, Pais_Cod, Pais_Nombre, "
+    "Sello_Cod, Sello_Nombre, Premios"
+)
+_GRABACION_COLUMNS = (
+    "Grabacion_Cod, Usuario_DNI, Usuario_Nombre, EsGuardadaPor_Fecha, Duracion"
+)
+
+# Page size for reads that may return whole partitions
+PAGE_SIZE = 500
+
+# Max in-flight requests for bulk writes
+BULK_CONCURRENCY = 128
+
+
+def _tune_statements(
+    prepared: Dict[str, PreparedStatement],
+    reads: Tuple[str, ...],
+    non_idempotent: Tuple[str, ...] = ()
+) -> None:
+    """Page the given reads at PAGE_SIZE and flag idempotent statements.
+
+    Only statements flagged idempotent may be retried or speculatively
+    executed by the driver; counter updates must never be.
+    """
+    for name in reads:
+        prepared[name].fetch_size = PAGE_SIZE
+    for name, statement in prepared.items():
+        statement.is_idempotent = name not in non_idempotent
+
+
+def _failures(records: Sequence, results) -> List[Tuple[Any, Exception]]:
+    """Pair each failed execute_concurrent result with the record it wrote."""
+    return [
+        (record, result)
+        for record, (success, result) in zip(records, results)
+        if not success
+    ]
+
+
+def _iter_result(future: ResponseFuture) -> Iterator:
+    """Iterate the rows of an already submitted query.
+
+    The query is in flight as soon as the future exists; this only blocks
+    on the first next(), so callers can do other work before reading.
+    """
+    yield from future.result()
+
+
+def _model_factory(model, convert: Optional[Callable[[Sequence], Sequence]] = None):
+    """Row factory that builds `model` instances straight from row values.
+
+    Repositories install it on a clone of the default execution profile,
+    so reads return domain objects without per-row attribute lookups.
+    Relies on the column order of the SELECT matching the positional
+    order of the model's fields (see the _*_COLUMNS projections).
+    `convert`, if given, adapts each row's values first.
+    """
+    if convert is None:
+        def factory(colnames, rows):
+            return [model(*row) for row in rows]
+    else:
+        def factory(colnames, rows):
+            return [model(*convert(row)) for row in rows]
+    return factory
+
+
+def _artista_values(row: Sequence) -> Sequence:
+    # Premios es un set<text> que llega como None o SortedSet
+    return (*row[:6], frozenset(row[6] or ()))
+
 
 class CassandraUsuarioRepository(IUsuarioRepository):
     """Cassandra implementation of IUsuarioRepository."""
 
     def __init__(self, session: Session):
         self.session = session
+        self._prepared = {
+            'get_by_dni': prepare_cached(session,
+                f"SELECT {_USUARIO_COLUMNS} FROM USERS_BY_DNI WHERE Usuario_DNI = ?"
+            ),
+            'get_by_nombre': prepare_cached(session,
+                f"SELECT {_USUARIO_COLUMNS} FROM USERS_BY_NAME WHERE Usuario_Nombre = ?"
+            ),
+            'save': prepare_cached(session, """
+                INSERT INTO USERS_BY_NAME (
+                    Usuario_Nombre,
+                    Usuario_DNI,
+                    Usuario_Email,
+                    Usuario_Telefono
+                )
+                VALUES (?, ?, ?, ?)
+            """),
+            'save_by_dni': prepare_cached(session, """
+                INSERT INTO USERS_BY_DNI (
+                    Usuario_DNI,
+                    Usuario_Nombre,
+                    Usuario_Email,
+                    Usuario_Telefono
+                )
+                VALUES (?, ?, ?, ?)
+            """),
+            'delete': prepare_cached(session,
+                "DELETE FROM USERS_BY_NAME WHERE Usuario_Nombre = ? AND Usuario_DNI = ?"
+            ),
+            'delete_by_dni': prepare_cached(session,
+                "DELETE FROM USERS_BY_DNI WHERE Usuario_DNI = ? AND Usuario_Nombre = ?"
+            )
+        }
+        _tune_statements(self._prepared, reads=('get_by_dni', 'get_by_nombre'))
+        self._profile = session.execution_profile_clone_update(
+            EXEC_PROFILE_DEFAULT, row_factory=_model_factory(Usuario))
 
     def get_by_dni(self, dni: str) -> List[Usuario]:
-        query = SimpleStatement(
-            "SELECT * FROM USERS_BY_NAME WHERE Usuario_DNI = %s ALLOW FILTERING",
-            fetch_size=100
-        )
-        rows = self.session.execute(query, [dni])
-        return [
-            Usuario(
-                nombre=row.usuario_nombre,
-                dni=row.usuario_dni,
-                email=row.usuario_email,
-                telefono=row.usuario_telefono
-            )
-            for row in rows
-        ]
+        return list(self.session.execute(
+            self._prepared['get_by_dni'], (dni,),
+            execution_profile=self._profile))
 
     def get_by_nombre(self, nombre: str) -> List[Usuario]:
-        query = SimpleStatement(
-            "SELECT * FROM USERS_BY_NAME WHERE Usuario_Nombre = %s"
-        )
-        rows = self.session.execute(query, [nombre])
-        return [
-            Usuario(
-                nombre=row.usuario_nombre,
-                dni=row.usuario_dni,
-                email=row.usuario_email,
-                telefono=row.usuario_telefono
-            )
-            for row in rows
-        ]
-
-    def save(self, usuario: Usuario) -> None:
-        query = SimpleStatement("""
-            INSERT INTO USERS_BY_NAME (
-                Usuario_Nombre,
-                Usuario_DNI,
-                Usuario_Email,
-                Usuario_Telefono
-            )
-            VALUES (%s, %s, %s, %s)
-        """)
-        self.session.execute(query, [
+        return list(self.session.execute(
+            self._prepared['get_by_nombre'], (nombre,),
+            execution_profile=self._profile))
+
+    def _save_batch(self, usuario: Usuario) -> BatchStatement:
+        # Tabla1 y su copia por DNI se escriben en un único batch LOGGED
+        batch = BatchStatement(batch_type=BatchType.LOGGED)
+        batch.add(self._prepared['save'], (
             usuario.nombre,
             usuario.dni,
             usuario.email,
             usuario.telefono
-        ])
+        ))
+        batch.add(self._prepared['save_by_dni'], (
+            usuario.dni,
+            usuario.nombre,
+            usuario.email,
+            usuario.telefono
+        ))
+        return batch
+
+    def save(self, usuario: Usuario) -> None:
+        self.session.execute(self._save_batch(usuario))
+
+    def save_many(self, usuarios: Sequence[Usuario]) -> List[Tuple[Usuario, Exception]]:
+        # Cada usuario sigue siendo un batch atómico; los batches de
+        # distintos usuarios se envían en paralelo
+        return _failures(usuarios, execute_concurrent(
+            self.session,
+            ((self._save_batch(usuario), ()) for usuario in usuarios),
+            concurrency=BULK_CONCURRENCY, raise_on_first_error=False))
 
-    def update_nombre(self, dni: str, nuevo_nombre: str) -> None:
+    def update_nombre(self, dni: str, nuevo_nombre: str) -> bool:
         # Get current user data
         usuarios = self.get_by_dni(dni)
-        for usuario in usuarios:
-            # Guardar nombre antiguo ANTES de actualizar
-            nombre_antiguo = usuario.nombre
-
-            # Borrar registro antiguo primero (con el nombre antiguo)
-            query_delete = SimpleStatement(
-                "DELETE FROM USERS_BY_NAME WHERE Usuario_Nombre = %s AND Usuario_DNI = %s"
-            )
-            self.session.execute(query_delete, [nombre_antiguo, usuario.dni])
 
-            # Actualizar nombre y guardar nuevo registro
-            usuario.nombre = nuevo_nombre
-            self.save(usuario)
+        # Por cada usuario, mover el registro del nombre antiguo al nuevo
+        # en USERS_BY_NAME y en USERS_BY_DNI en un único batch LOGGED,
+        # de modo que el cambio de nombre sea atómico. Los batches
+        # de distintos usuarios se envían en paralelo; si el nombre no
+        # cambia no hay nada que hacer.
+        futures: List[ResponseFuture] = []
+        for usuario in usuarios:
+            if usuario.nombre == nuevo_nombre:
+                continue
+            batch = BatchStatement(batch_type=BatchType.LOGGED)
+            batch.add(self._prepared['delete'], (usuario.nombre, usuario.dni))
+            batch.add(self._prepared['delete_by_dni'], (usuario.dni, usuario.nombre))
+            batch.add(self._prepared['save'], (
+                nuevo_nombre,
+                usuario.dni,
+                usuario.email,
+                usuario.telefono
+            ))
+            batch.add(self._prepared['save_by_dni'], (
+                usuario.dni,
+                nuevo_nombre,
+                usuario.email,
+                usuario.telefono
+            ))
+            futures.append(self.session.execute_async(batch))
+
+        for future in futures:
+            future.result()
+        return bool(usuarios)
 
 
 class CassandraCancionRepository(ICancionRepository):
@@ -90,64 +211,57 @@ class CassandraCancionRepository(ICancionRepository):
 
     def __init__(self, session: Session):
         self.session = session
+        self._prepared = {
+            'get_by_isrc': prepare_cached(session,
+                f"SELECT {_CANCION_COLUMNS} FROM MUSICS_BY_GENDER WHERE Cancion_ISRC = ?"
+            ),
+            'get_by_isrc_genero': prepare_cached(session,
+                f"SELECT {_CANCION_COLUMNS} FROM MUSICS_BY_GENDER WHERE Cancion_Genero = ? AND Cancion_ISRC = ?"
+            ),
+            'get_by_genero': prepare_cached(session,
+                f"SELECT {_CANCION_COLUMNS} FROM MUSICS_BY_GENDER WHERE Cancion_Genero = ?"
+            ),
+            'save': prepare_cached(session, """
+                INSERT INTO MUSICS_BY_GENDER (
+                    Cancion_Genero,
+                    Cancion_ISRC,
+                    Cancion_Titulo,
+                    Cancion_Anio,
+                    Cancion_Generos,
+                    Artista_Cod,
+                    Artista_Nombre
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """)
+        }
+        _tune_statements(
+            self._prepared,
+            reads=('get_by_isrc', 'get_by_isrc_genero', 'get_by_genero'))
+        self._profile = session.execution_profile_clone_update(
+            EXEC_PROFILE_DEFAULT, row_factory=_model_factory(Cancion))
 
     def get_by_isrc(self, isrc: str, genero_hint: Optional[str] = None) -> List[Cancion]:
         if genero_hint:
-            query = SimpleStatement(
-                "SELECT * FROM MUSICS_BY_GENDER WHERE Cancion_Genero = %s AND Cancion_ISRC = %s"
-            )
-            rows = self.session.execute(query, [genero_hint, isrc])
-        else:
-            query = SimpleStatement(
-                "SELECT * FROM MUSICS_BY_GENDER WHERE Cancion_ISRC = %s"
-            )
-            rows = self.session.execute(query, [isrc])
-
-        return [
-            Cancion(
-                isrc=row.cancion_isrc,
-                titulo=row.cancion_titulo,
-                anio=row.cancion_anio,
-                generos=row.cancion_generos,
-                genero_principal=row.cancion_genero,
-                artista_cod=row.artista_cod,
-                artista_nombre=row.artista_nombre
-            )
-            for row in rows
-        ]
-
-    def get_by_genero(self, genero: str) -> List[Cancion]:
-        query = SimpleStatement(
-            "SELECT * FROM MUSICS_BY_GENDER WHERE Cancion_Genero = %s"
-        )
-        rows = self.session.execute(query, [genero])
-        return [
-            Cancion(
-                isrc=row.cancion_isrc,
-                titulo=row.cancion_titulo,
-                anio=row.cancion_anio,
-                generos=row.cancion_generos,
-                genero_principal=row.cancion_genero,
-                artista_cod=row.artista_cod,
-                artista_nombre=row.artista_nombre
-            )
-            for row in rows
-        ]
-
-    def save(self, cancion: Cancion) -> None:
-        query = SimpleStatement("""
-            INSERT INTO MUSICS_BY_GENDER (
-                Cancion_Genero,
-                Cancion_ISRC,
-                Cancion_Titulo,
-                Cancion_Anio,
-                Cancion_Generos,
-                Artista_Cod,
-                Artista_Nombre
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """)
-        self.session.execute(query, [
+            return list(self.session.execute(
+                self._prepared['get_by_isrc_genero'], (genero_hint, isrc),
+                execution_profile=self._profile))
+        return list(self.get_by_isrc_async(isrc).result())
+
+    def get_by_isrc_async(self, isrc: str) -> ResponseFuture:
+        """Start the ISRC lookup without blocking; .result() yields Cancion objects."""
+        return self.session.execute_async(
+            self._prepared['get_by_isrc'], (isrc,),
+            execution_profile=self._profile)
+
+    def get_by_genero(self, genero: str) -> Iterator[Cancion]:
+        future = self.session.execute_async(
+            self._prepared['get_by_genero'], (genero,),
+            execution_profile=self._profile)
+        return _iter_result(future)
+
+    @staticmethod
+    def _save_params(cancion: Cancion) -> Tuple:
+        return (
             cancion.genero_principal,
             cancion.isrc,
             cancion.titulo,
@@ -155,7 +269,16 @@ class CassandraCancionRepository(ICancionRepository):
             cancion.generos,
             cancion.artista_cod,
             cancion.artista_nombre
-        ])
+        )
+
+    def save(self, cancion: Cancion) -> None:
+        self.session.execute(self._prepared['save'], self._save_params(cancion))
+
+    def save_many(self, canciones: Sequence[Cancion]) -> List[Tuple[Cancion, Exception]]:
+        return _failures(canciones, execute_concurrent_with_args(
+            self.session, self._prepared['save'],
+            (self._save_params(cancion) for cancion in canciones),
+            concurrency=BULK_CONCURRENCY, raise_on_first_error=False))
 
 
 class CassandraGrabacionRepository(IGrabacionRepository):
@@ -163,99 +286,84 @@ class CassandraGrabacionRepository(IGrabacionRepository):
 
     def __init__(self, session: Session):
         self.session = session
+        self._prepared = {
+            'get_by_codigo': prepare_cached(session,
+                f"SELECT {_GRABACION_COLUMNS} FROM USERS_BY_RECORD WHERE Grabacion_Cod = ?"
+            ),
+            'get_by_fecha': prepare_cached(session,
+                f"SELECT {_GRABACION_COLUMNS} FROM RECORDS_BY_DATE WHERE EsGuardadaPor_Fecha = ?"
+            ),
+            'save_users_by_record': prepare_cached(session, """
+                INSERT INTO USERS_BY_RECORD (
+                    Grabacion_Cod,
+                    Usuario_DNI,
+                    Usuario_Nombre,
+                    Usuario_Email,
+                    Usuario_Telefono,
+                    EsGuardadaPor_Fecha,
+                    Duracion
+                )
+                VALUES (?, ?, ?, NULL, NULL, ?, ?)
+            """),
+            'save_records_by_date': prepare_cached(session, """
+                INSERT INTO RECORDS_BY_DATE (
+                    EsGuardadaPor_Fecha,
+                    Grabacion_Cod,
+                    Usuario_DNI,
+                    Usuario_Nombre,
+                    Duracion
+                )
+                VALUES (?, ?, ?, ?, ?)
+            """),
+            'delete_by_fecha': prepare_cached(session,
+                "DELETE FROM RECORDS_BY_DATE WHERE EsGuardadaPor_Fecha = ?"
+            )
+        }
+        _tune_statements(self._prepared, reads=('get_by_codigo', 'get_by_fecha'))
+        self._profile = session.execution_profile_clone_update(
+            EXEC_PROFILE_DEFAULT, row_factory=_model_factory(Grabacion))
 
-    def get_by_codigo(self, codigo: int) -> List[Grabacion]:
+    def get_by_codigo(self, codigo: int) -> Iterator[Grabacion]:
         # Obtener usuarios asociados a la grabación desde Tabla2 (ahora incluye la fecha)
-        query = SimpleStatement(
-            "SELECT * FROM USERS_BY_RECORD WHERE Grabacion_Cod = %s"
-        )
-        rows = self.session.execute(query, [codigo])
-        return [
-            Grabacion(
-                codigo=row.grabacion_cod,
-                usuario_dni=row.usuario_dni,
-                usuario_nombre=row.usuario_nombre,
-                fecha_guardado=row.esguardadapor_fecha if hasattr(
-                    row, 'esguardadapor_fecha') else None,
-                duracion=row.duracion if hasattr(row, 'duracion') else None
-            )
-            for row in rows
-        ]
+        future = self.session.execute_async(
+            self._prepared['get_by_codigo'], (codigo,),
+            execution_profile=self._profile)
+        return _iter_result(future)
 
-    def get_by_fecha(self, fecha: date) -> List[Grabacion]:
-        query = SimpleStatement(
-            "SELECT * FROM RECORDS_BY_DATE WHERE EsGuardadaPor_Fecha = %s"
-        )
-        rows = self.session.execute(query, [fecha])
-        return [
-            Grabacion(
-                codigo=row.grabacion_cod,
-                usuario_dni=row.usuario_dni,
-                usuario_nombre=row.usuario_nombre,
-                fecha_guardado=row.esguardadapor_fecha,
-                duracion=row.duracion if hasattr(row, 'duracion') else None
-            )
-            for row in rows
-        ]
+    def get_by_fecha(self, fecha: date) -> Iterator[Grabacion]:
+        future = self.session.execute_async(
+            self._prepared['get_by_fecha'], (fecha,),
+            execution_profile=self._profile)
+        return _iter_result(future)
 
     def save(self, grabacion: Grabacion) -> None:
+        # Tabla2 y Tabla6 se escriben juntas en un único batch LOGGED
+        batch = BatchStatement(batch_type=BatchType.LOGGED)
+
         # Insert into Tabla2 (ahora con fecha)
-        query2 = SimpleStatement("""
-            INSERT INTO USERS_BY_RECORD (
-                Grabacion_Cod,
-                Usuario_DNI,
-                Usuario_Nombre,
-                Usuario_Email,
-                Usuario_Telefono,
-                EsGuardadaPor_Fecha,
-                Duracion
-            )
-            VALUES (%s, %s, %s, NULL, NULL, %s, %s)
-        """)
-        self.session.execute(query2, [
+        batch.add(self._prepared['save_users_by_record'], (
             grabacion.codigo,
             grabacion.usuario_dni,
             grabacion.usuario_nombre,
             grabacion.fecha_guardado,
             grabacion.duracion
-        ])
+        ))
 
         # Insert into Tabla6
-        query6 = SimpleStatement("""
-            INSERT INTO RECORDS_BY_DATE (
-                EsGuardadaPor_Fecha,
-                Grabacion_Cod,
-                Usuario_DNI,
-                Usuario_Nombre,
-                Duracion
-            )
-            VALUES (%s, %s, %s, %s, %s)
-        """)
-        self.session.execute(query6, [
+        batch.add(self._prepared['save_records_by_date'], (
             grabacion.fecha_guardado,
             grabacion.codigo,
             grabacion.usuario_dni,
             grabacion.usuario_nombre,
             grabacion.duracion
-        ])
+        ))
+
+        self.session.execute(batch)
 
     def delete_by_fecha(self, fecha: date) -> None:
-        # First get all grabaciones for the date
-        grabaciones = self.get_by_fecha(fecha)
-
-        # Delete each grabacion
-        query = SimpleStatement("""
-            DELETE FROM RECORDS_BY_DATE
-            WHERE EsGuardadaPor_Fecha = %s 
-            AND Grabacion_Cod = %s 
-            AND Usuario_DNI = %s
-        """)
-        for grabacion in grabaciones:
-            self.session.execute(query, [
-                fecha,
-                grabacion.codigo,
-                grabacion.usuario_dni
-            ])
+        # La fecha es la clave de partición de Tabla6: se borra la
+        # partición completa con un único DELETE
+        self.session.execute(self._prepared['delete_by_fecha'], (fecha,))
 
 
 class CassandraArtistaRepository(IArtistaRepository):
@@ -263,44 +371,70 @@ class CassandraArtistaRepository(IArtistaRepository):
 
     def __init__(self, session: Session):
         self.session = session
+        self._prepared = {
+            'save_mapping': prepare_cached(session, """
+                INSERT INTO MAPPING_ISRC (
+                    Cancion_ISRC,
+                    Pais_Cod,
+                    Artista_Cod,
+                    Pais_Nombre,
+                    Artista_Nombre,
+                    Sello_Cod,
+                    Sello_Nombre,
+                    Premios
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """),
+            'increment_count': prepare_cached(session, """
+                UPDATE ARTISTS_BY_COUNTRY
+                SET Artista_Count = Artista_Count + 1
+                WHERE Pais_Cod = ?
+            """),
+            'get_count': prepare_cached(session,
+                "SELECT Artista_Count FROM ARTISTS_BY_COUNTRY WHERE Pais_Cod = ?"
+            ),
+            'get_by_isrc': prepare_cached(session,
+                f"SELECT {_ARTISTA_COLUMNS} FROM MAPPING_ISRC WHERE Cancion_ISRC = ?"
+            )
+        }
+        _tune_statements(
+            self._prepared, reads=(), non_idempotent=('increment_count',))
+        # A country has a single counter row
+        self._prepared['get_count'].fetch_size = 1
+        self._profile = session.execution_profile_clone_update(
+            EXEC_PROFILE_DEFAULT,
+            row_factory=_model_factory(Artista, _artista_values))
+
+    def get_by_isrc_async(self, isrc: str) -> ResponseFuture:
+        """Start the Tabla3 lookup without blocking; .result() yields Artista objects."""
+        return self.session.execute_async(
+            self._prepared['get_by_isrc'], (isrc,),
+            execution_profile=self._profile)
+
+    def save_with_pais(self, artista: Artista, cancion_isrc: str) -> None:
+        # Counter updates cannot be batched with regular writes, so the
+        # Tabla3 insert and the Tabla4 update are sent in parallel instead
 
-    def save_with_pais(self, artista: Artista) -> None:
         # Insert into Tabla3
-        query3 = SimpleStatement("""
-            INSERT INTO MAPPING_ISRC (
-                Cancion_ISRC,
-                Pais_Cod,
-                Artista_Cod,
-                Pais_Nombre,
-                Artista_Nombre,
-                Sello_Cod,
-                Sello_Nombre,
-                Premios
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """)
-        self.session.execute(query3, [
-            artista.isrc if hasattr(artista, 'isrc') else None,
+        fut_mapping = self.session.execute_async(self._prepared['save_mapping'], (
+            cancion_isrc,
             artista.pais_cod,
             artista.codigo,
             artista.pais_nombre,
             artista.nombre,
             artista.sello_cod,
             artista.sello_nombre,
-            artista.premios if hasattr(artista, 'premios') else set()
-        ])
+            artista.premios
+        ))
 
         # Update counter in Tabla4
-        query4 = SimpleStatement("""
-            UPDATE ARTISTS_BY_COUNTRY
-            SET Artista_Count = Artista_Count + 1 
-            WHERE Pais_Cod = %s
-        """)
-        self.session.execute(query4, [artista.pais_cod])
+        fut_count = self.session.execute_async(
+            self._prepared['increment_count'], (artista.pais_cod,))
+
+        fut_mapping.result()
+        fut_count.result()
 
     def get_count_by_pais(self, pais_cod: int) -> int:
-        query = SimpleStatement(
-            "SELECT Artista_Count FROM ARTISTS_BY_COUNTRY WHERE Pais_Cod = %s"
-        )
-        rows = list(self.session.execute(query, [pais_cod]))
-        return rows[0].artista_count if rows else 0
+        row = self.session.execute(
+            self._prepared['get_count'], (pais_cod,)).one()
+        return row.artista_count if row else 0
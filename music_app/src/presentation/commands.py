@@ -5,11 +5,22 @@ until a correct value is provided (cedula/numeric, int/float, email, date...).
 """
 from abc import ABC, abstractmethod
 from datetime import date
-import re
-from typing import List, Optional, Set
+import json
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, TextIO
 
 from ..application.services import MusicService
 from ..config.config import load_config
+from ..domain.models import Cancion, Usuario
+
+# google-re2 (optional) matches in linear time without backtracking, which
+# pays off when --batch-json validates many records; same fullmatch API
+try:
+    import re2 as _re_engine
+    # Other packages named re2 exist; only use one with fullmatch
+    _re_engine.compile("").fullmatch("")
+except (ImportError, AttributeError):
+    import re as _re_engine
 
 
 # --- Input validation helpers ---
@@ -17,128 +28,125 @@ _config = load_config()
 DEFAULT_MAX_RETRIES = _config.max_retries
 
 
-def prompt_nonempty(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES) -> Optional[str]:
+# Compiled once; each validator is a single fullmatch on the stripped input.
+# Explicit ASCII classes instead of \d and \s: re treats those as Unicode
+# and RE2 as ASCII, so this keeps validation identical with either engine.
+_DIGITS_RE = _re_engine.compile(r"[0-9]+")
+_INT_RE = _re_engine.compile(r"[+-]?[0-9]+")
+_FLOAT_RE = _re_engine.compile(r"[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?")
+_DATE_RE = _re_engine.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+EMAIL_RE = _re_engine.compile(r"[^@ \t\r\n]+@[^@ \t\r\n]+\.[^@ \t\r\n]+")
+
+CANCELLED = object()
+
+# Returned by parsers to reject an input (None is a valid optional value)
+_INVALID = object()
+
+
+def _regex_parser(regex: Any, convert: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Build a parser that converts the input only if it fully matches regex."""
+    def parse(v: str):
+        return convert(v) if regex.fullmatch(v) else _INVALID
+    return parse
+
+
+def _parse_date(v: str):
+    # fromisoformat also accepts e.g. "20240105" and "2024-W01-1"
+    if not _DATE_RE.fullmatch(v):
+        return _INVALID
+    try:
+        return date.fromisoformat(v)
+    except ValueError:
+        return _INVALID
+
+
+def _parse_genres(v: str) -> Set[str]:
+    return {g.strip() for g in v.split(",") if g.strip()}
+
+
+def _prompt_with(
+    prompt: str,
+    parse: Callable[[str], Any],
+    error_msg: str,
+    max_retries: int,
+    empty_msg: Optional[str] = None,
+    cancelled: Any = None
+):
+    """Ask until parse accepts the input or max_retries is reached.
+
+    If empty_msg is given, an empty input is rejected with that message
+    without calling parse. Returns `cancelled` when retries run out.
+    """
     tries = 0
     while tries < max_retries:
         v = input(prompt).strip()
-        if v:
-            return v
-        print("Entrada vacía. Intenta de nuevo.")
+        if not v and empty_msg:
+            print(empty_msg)
+        else:
+            value = parse(v)
+            if value is not _INVALID:
+                return value
+            print(error_msg)
         tries += 1
     print("Máximo de intentos alcanzado. Operación cancelada.")
-    return None
+    return cancelled
+
+
+_parse_digits = _regex_parser(_DIGITS_RE, str)
+_parse_int = _regex_parser(_INT_RE, int)
+_parse_float = _regex_parser(_FLOAT_RE, float)
+_parse_email = _regex_parser(EMAIL_RE, str)
+
+
+def prompt_nonempty(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES) -> Optional[str]:
+    return _prompt_with(prompt, str, "", max_retries,
+                        empty_msg="Entrada vacía. Intenta de nuevo.")
 
 
 def prompt_digits(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES) -> Optional[str]:
     """Solicita solo dígitos (números enteros representados como string)."""
-    tries = 0
-    while tries < max_retries:
-        v = input(prompt).strip()
-        if v.isdigit():
-            return v
-        print("Por favor ingresa solo números (sin espacios ni signos).")
-        tries += 1
-    print("Máximo de intentos alcanzado. Operación cancelada.")
-    return None
+    return _prompt_with(prompt, _parse_digits,
+                        "Por favor ingresa solo números (sin espacios ni signos).",
+                        max_retries)
 
 
 def prompt_int(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES) -> Optional[int]:
     """Solicita un entero obligatorio (no puede estar vacío)."""
-    tries = 0
-    while tries < max_retries:
-        v = input(prompt).strip()
-        if not v:
-            print("Entrada vacía. Intenta de nuevo.")
-            tries += 1
-            continue
-        if v.lstrip("+-").isdigit():
-            try:
-                return int(v)
-            except ValueError:
-                pass
-        print("Valor inválido. Ingresa un número entero válido.")
-        tries += 1
-    print("Máximo de intentos alcanzado. Operación cancelada.")
-    return None
+    return _prompt_with(prompt, _parse_int,
+                        "Valor inválido. Ingresa un número entero válido.",
+                        max_retries, empty_msg="Entrada vacía. Intenta de nuevo.")
 
 
 def prompt_float(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES) -> Optional[float]:
     """Solicita un decimal obligatorio (no puede estar vacío)."""
-    tries = 0
-    while tries < max_retries:
-        v = input(prompt).strip()
-        if not v:
-            print("Entrada vacía. Intenta de nuevo.")
-            tries += 1
-            continue
-        try:
-            return float(v)
-        except ValueError:
-            print("Valor inválido. Ingresa un número (decimal) válido.")
-            tries += 1
-    print("Máximo de intentos alcanzado. Operación cancelada.")
-    return None
-
-
-EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+    return _prompt_with(prompt, _parse_float,
+                        "Valor inválido. Ingresa un número (decimal) válido.",
+                        max_retries, empty_msg="Entrada vacía. Intenta de nuevo.")
 
 
 def prompt_email(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES) -> Optional[str]:
-    tries = 0
-    while tries < max_retries:
-        v = input(prompt).strip()
-        if EMAIL_RE.match(v):
-            return v
-        print("Email inválido. Ingresa un email válido (ej: usuario@dominio.com).")
-        tries += 1
-    print("Máximo de intentos alcanzado. Operación cancelada.")
-    return None
+    return _prompt_with(prompt, _parse_email,
+                        "Email inválido. Ingresa un email válido (ej: usuario@dominio.com).",
+                        max_retries)
 
 
 def prompt_date(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES) -> Optional[date]:
-    tries = 0
-    while tries < max_retries:
-        v = input(prompt).strip()
-        try:
-            y, m, d = map(int, v.split("-"))
-            return date(y, m, d)
-        except Exception:
-            print("Fecha inválida. Usa el formato YYYY-MM-DD y valores válidos.")
-            tries += 1
-    print("Máximo de intentos alcanzado. Operación cancelada.")
-    return None
-
-
-CANCELLED = object()
+    return _prompt_with(prompt, _parse_date,
+                        "Fecha inválida. Usa el formato YYYY-MM-DD y valores válidos.",
+                        max_retries)
 
 
 def prompt_optional_int(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES):
     """Retorna int, None (si el usuario dejó vacío) o CANCELLED (si se agotaron reintentos)."""
-    tries = 0
-    while tries < max_retries:
-        v = input(prompt).strip()
-        if v == "":
-            return None
-        if v.lstrip("+-").isdigit():
-            return int(v)
-        print("Valor inválido. Ingresa un número entero o deja vacío.")
-        tries += 1
-    print("Máximo de intentos alcanzado. Operación cancelada.")
-    return CANCELLED
+    return _prompt_with(prompt, lambda v: _parse_int(v) if v else None,
+                        "Valor inválido. Ingresa un número entero o deja vacío.",
+                        max_retries, cancelled=CANCELLED)
 
 
 def prompt_genres(prompt: str, max_retries: int = DEFAULT_MAX_RETRIES) -> Optional[Set[str]]:
     """Solicita géneros separados por coma (obligatorio, no puede estar vacío)."""
-    tries = 0
-    while tries < max_retries:
-        v = input(prompt).strip()
-        if not v:
-            print("Géneros no pueden estar vacíos. Intenta de nuevo.")
-            tries += 1
-            continue
-        return {g.strip() for g in v.split(",") if g.strip()}
-    print("Máximo de intentos alcanzado. Operación cancelada.")
-    return None
+    return _prompt_with(prompt, _parse_genres, "", max_retries,
+                        empty_msg="Géneros no pueden estar vacíos. Intenta de nuevo.")
 
 
 def check_input(value, field_name: str = "campo") -> bool:
@@ -149,6 +157,78 @@ def check_input(value, field_name: str = "campo") -> bool:
     return True
 
 
+def print_results(resultados: Iterable, empty_message: str) -> None:
+    """Print each result as it arrives; print empty_message if there are none.
+
+    Works with lazily paged results, which are always truthy.
+    """
+    found = False
+    for r in resultados:
+        print(r)
+        found = True
+    if not found:
+        print(empty_message)
+
+
+def _json_field(
+    record: Dict[str, Any],
+    name: str,
+    parse: Callable[[str], Any] = str,
+    numeric: bool = False
+):
+    """Validate one field of a JSON record with the same parsers as the prompts.
+
+    Text fields must be JSON strings; numeric fields may also be JSON
+    integers (but not booleans, which are ints in Python).
+    """
+    v = record.get(name)
+    allowed = (str, int) if numeric else str
+    if isinstance(v, allowed) and not isinstance(v, bool):
+        value = parse(str(v).strip())
+    else:
+        value = _INVALID
+    if value is _INVALID or value == "":
+        raise ValueError(f"campo '{name}' inválido: {v!r}")
+    return value
+
+
+def _json_generos(record: Dict[str, Any]) -> Set[str]:
+    """Géneros as a JSON list or as a comma-separated string."""
+    v = record.get("generos")
+    if isinstance(v, list):
+        if not all(isinstance(g, str) for g in v):
+            raise ValueError(f"campo 'generos' inválido: {v!r}")
+        generos = {g.strip() for g in v if g.strip()}
+    elif isinstance(v, str):
+        generos = _parse_genres(v)
+    else:
+        generos = set()
+    if not generos:
+        raise ValueError(f"campo 'generos' inválido: {v!r}")
+    return generos
+
+
+def _usuario_from_json(record: Dict[str, Any]) -> Usuario:
+    return Usuario(
+        nombre=_json_field(record, "nombre"),
+        dni=_json_field(record, "dni", _parse_digits, numeric=True),
+        email=_json_field(record, "email", _parse_email),
+        telefono=_json_field(record, "telefono", _parse_digits, numeric=True)
+    )
+
+
+def _cancion_from_json(record: Dict[str, Any]) -> Cancion:
+    return Cancion(
+        isrc=_json_field(record, "isrc"),
+        titulo=_json_field(record, "titulo"),
+        anio=_json_field(record, "anio", _parse_int, numeric=True),
+        generos=_json_generos(record),
+        genero_principal=_json_field(record, "genero_principal"),
+        artista_cod=_json_field(record, "artista_cod", _parse_int, numeric=True),
+        artista_nombre=_json_field(record, "artista_nombre")
+    )
+
+
 # --- end helpers ---
 
 
@@ -305,8 +385,10 @@ class ActualizarNombreUsuarioCommand(Command):
         if not check_input(nuevo, "Nuevo nombre"):
             return
 
-        self.service.actualizar_nombre_usuario(dni, nuevo)
-        print("Nombre actualizado exitosamente.")
+        if self.service.actualizar_nombre_usuario(dni, nuevo):
+            print("Nombre actualizado exitosamente.")
+        else:
+            print("Usuario no encontrado.")
 
 
 class BorrarGrabacionesFechaCommand(Command):
@@ -334,12 +416,9 @@ class ConsultarUsuariosNombreCommand(Command):
         nombre = prompt_nonempty("Nombre: ")
         if not check_input(nombre, "Nombre"):
             return
-        resultados = self.service.buscar_usuarios_por_nombre(nombre)
-        if resultados:
-            for r in resultados:
-                print(r)
-        else:
-            print("No se encontraron usuarios con ese nombre.")
+        print_results(
+            self.service.buscar_usuarios_por_nombre(nombre),
+            "No se encontraron usuarios con ese nombre.")
 
 
 class ConsultarUsuariosGrabacionCommand(Command):
@@ -352,12 +431,9 @@ class ConsultarUsuariosGrabacionCommand(Command):
         grab_cod = prompt_int("Grabacion_Cod (int): ")
         if not check_input(grab_cod, "Grabacion_Cod"):
             return
-        resultados = self.service.buscar_usuarios_por_grabacion(grab_cod)
-        if resultados:
-            for r in resultados:
-                print(r)
-        else:
-            print("No se encontraron usuarios para esa grabación.")
+        print_results(
+            self.service.buscar_usuarios_por_grabacion(grab_cod),
+            "No se encontraron usuarios para esa grabación.")
 
 
 class ConsultarArtistaPaisCommand(Command):
@@ -370,12 +446,9 @@ class ConsultarArtistaPaisCommand(Command):
         isrc = prompt_nonempty("ISRC: ")
         if not check_input(isrc, "ISRC"):
             return
-        resultados = self.service.buscar_artista_pais_por_isrc(isrc)
-        if resultados:
-            for r in resultados:
-                print(r)
-        else:
-            print("No se encontró información para ese ISRC.")
+        print_results(
+            self.service.buscar_artista_pais_por_isrc(isrc),
+            "No se encontró información para ese ISRC.")
 
 
 class ConsultarConteoArtistasPaisCommand(Command):
@@ -402,12 +475,9 @@ class ConsultarCancionesGeneroCommand(Command):
         genero = prompt_nonempty("Género: ")
         if not check_input(genero, "Género"):
             return
-        resultados = self.service.buscar_canciones_por_genero(genero)
-        if resultados:
-            for r in resultados:
-                print(r)
-        else:
-            print("No se encontraron canciones para ese género.")
+        print_results(
+            self.service.buscar_canciones_por_genero(genero),
+            "No se encontraron canciones para ese género.")
 
 
 class ConsultarGrabacionesFechaCommand(Command):
@@ -420,10 +490,57 @@ class ConsultarGrabacionesFechaCommand(Command):
         fecha = prompt_date("Fecha (YYYY-MM-DD): ")
         if not check_input(fecha, "Fecha"):
             return
-        resultados = self.service.buscar_grabaciones_por_fecha(
-            date(fecha.year, fecha.month, fecha.day))
-        if resultados:
-            for r in resultados:
-                print(r)
-        else:
-            print("No se encontraron grabaciones para esa fecha.")
+        print_results(
+            self.service.buscar_grabaciones_por_fecha(fecha),
+            "No se encontraron grabaciones para esa fecha.")
+
+
+class CargaMasivaJsonCommand(Command):
+    """Command for bulk loading usuarios and canciones from JSON lines.
+
+    Each line is an object with a "tipo" ("usuario" or "cancion") and the
+    same fields the interactive commands ask for. Invalid lines are
+    reported and skipped; valid records are written concurrently, and
+    records whose write fails are reported without stopping the load.
+    """
+
+    _PARSERS = {
+        "usuario": _usuario_from_json,
+        "cancion": _cancion_from_json,
+    }
+
+    def __init__(self, service: MusicService, stream: Optional[TextIO] = None):
+        self.service = service
+        self.stream = stream if stream is not None else sys.stdin
+
+    def execute(self) -> None:
+        records: Dict[str, list] = {tipo: [] for tipo in self._PARSERS}
+        invalidas = 0
+        for n, line in enumerate(self.stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("se esperaba un objeto JSON")
+                tipo = record.get("tipo")
+                if not isinstance(tipo, str) or tipo not in self._PARSERS:
+                    raise ValueError(f"tipo desconocido: {tipo!r}")
+                records[tipo].append(self._PARSERS[tipo](record))
+            except ValueError as e:
+                print(f"Línea {n} ignorada: {e}")
+                invalidas += 1
+
+        usuarios_fallidos = self.service.crear_usuarios(records["usuario"])
+        for usuario, error in usuarios_fallidos:
+            print(f"Usuario {usuario.dni} no insertado: {error}")
+        canciones_fallidas = self.service.crear_canciones(records["cancion"])
+        for cancion, error in canciones_fallidas:
+            print(f"Canción {cancion.isrc} no insertada: {error}")
+
+        print(
+            f"Insertados {len(records['usuario']) - len(usuarios_fallidos)} usuarios y "
+            f"{len(records['cancion']) - len(canciones_fallidas)} canciones "
+            f"({invalidas} líneas inválidas, "
+            f"{len(usuarios_fallidos) + len(canciones_fallidas)} escrituras fallidas)."
+        )